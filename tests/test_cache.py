@@ -21,6 +21,7 @@ def test_cache_info() -> None:
         "ip_address",
         "host_validate",
         "encode_host",
+        "parse_url",
     }
 
 
@@ -69,15 +70,40 @@ def test_cache_configure_None_only_deprecated() -> None:
     assert yarl.cache_info()["encode_host"].maxsize is None
 
 
+def test_cache_configure_mixed_None_and_size_deprecated() -> None:
+    with pytest.warns(DeprecationWarning):
+        yarl.cache_configure(ip_address_size=None, host_validate_size=10)
+    assert yarl.cache_info()["encode_host"].maxsize is None
+
+
+def test_cache_configure_max_of_deprecated_sizes() -> None:
+    with pytest.warns(DeprecationWarning):
+        yarl.cache_configure(
+            ip_address_size=64, host_validate_size=32, encode_host_size=16
+        )
+    assert yarl.cache_info()["encode_host"].maxsize == 64
+
+
 def test_cache_configure_explicit() -> None:
     yarl.cache_configure(
         idna_decode_size=128,
         idna_encode_size=128,
         encode_host_size=128,
+        parse_url_size=128,
     )
     assert yarl.cache_info()["idna_decode"].maxsize == 128
     assert yarl.cache_info()["idna_encode"].maxsize == 128
     assert yarl.cache_info()["encode_host"].maxsize == 128
+    assert yarl.cache_info()["parse_url"].maxsize == 128
+
+
+def test_cache_clear_parse_url() -> None:
+    url = yarl.URL("http://cache-clear.example.com/")
+    assert yarl.URL("http://cache-clear.example.com/") is url
+    assert yarl.cache_info()["parse_url"].currsize > 0
+    yarl.cache_clear()
+    assert yarl.cache_info()["parse_url"].currsize == 0
+    assert yarl.URL("http://cache-clear.example.com/") is not url
 
 
 def test_cache_configure_waring() -> None:
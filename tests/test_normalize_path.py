@@ -1,6 +1,6 @@
 import pytest
 
-from yarl._path import normalize_path
+from yarl._path import has_dot_segments, normalize_path
 
 PATHS = [
     # No dots
@@ -34,3 +34,24 @@ PATHS = [
 @pytest.mark.parametrize("original,expected", PATHS)
 def test__normalize_path(original, expected):
     assert normalize_path(original) == expected
+
+
+@pytest.mark.parametrize("original,expected", PATHS)
+def test__has_dot_segments(original, expected):
+    assert has_dot_segments(original) is (original != expected)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [".", "..", "./", "../", "/.", "/..", "a/./b", "a/../b", "a/.", "a/.."],
+)
+def test__has_dot_segments_true(path):
+    assert has_dot_segments(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/file.txt", "/.hidden", "/..hidden", "/a./b", "/a../b", "/a.", "/...", ".../"],
+)
+def test__has_dot_segments_false(path):
+    assert not has_dot_segments(path)
@@ -36,7 +36,7 @@ def test_pickle_does_not_pollute_cache():
 
     Since unpickle will call URL.__new__ with default
     args, we need to make sure that default args never
-    end up in the pre_encoded_url or encode_url cache.
+    end up in the parse_url cache.
     """
     u1 = URL.__new__(URL)
     u1._scheme = "this"
@@ -459,6 +459,35 @@ def test_quote_fastpath_pct(quoter):
     assert s1 is s2
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("/path/to%20file/x%C3%A9", "/path/to%20file/x%C3%A9"),
+        ("/path%2Fto+x%2B", "/path%2Fto+x%2B"),
+        ("/path%41", "/pathA"),
+        ("/path%2f", "/path%2F"),
+        ("/path%c3%a9", "/path%C3%A9"),
+        ("/path%zz", "/path%25zz"),
+        ("/path%2", "/path%252"),
+    ],
+)
+def test_requote_already_quoted(quoter, value, expected):
+    assert quoter(safe="@:", protected="/+")(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("/path/to/file.html", "/path/to/file.html"),
+        ("/path%20to", "/path%2520to"),
+        ("/path to", "/path%20to"),
+        ("/päth", "/p%C3%A4th"),
+    ],
+)
+def test_quote_without_requote_fastpath(quoter, value, expected):
+    assert quoter(safe="@:", protected="/+", requote=False)(value) == expected
+
+
 def test_quote_very_large_string(quoter):
     # more than 8 KiB
     s = "abcфух%30%0a" * 1024
@@ -480,7 +509,20 @@ def test_unquoter_path_with_plus(unquoter):
     assert "/test/x+y+z/:++/" == unquoter(unsafe="+")(s)
 
 
-@given(safe=st.text(), protected=st.text(), qs=st.booleans(), requote=st.booleans())
+@pytest.mark.parametrize(
+    "kwargs", [{"safe": "é"}, {"protected": "é"}], ids=["safe", "protected"]
+)
+def test_quoter_non_ascii_safe(quoter, kwargs):
+    with pytest.raises(ValueError, match="ORD < 128"):
+        quoter(**kwargs)
+
+
+@given(
+    safe=st.text(alphabet=st.characters(max_codepoint=127)),
+    protected=st.text(alphabet=st.characters(max_codepoint=127)),
+    qs=st.booleans(),
+    requote=st.booleans(),
+)
 def test_fuzz__PyQuoter(safe, protected, qs, requote):
     """Verify that _PyQuoter can be instantiated with any valid arguments."""
     assert _PyQuoter(safe=safe, protected=protected, qs=qs, requote=requote)
@@ -51,6 +51,12 @@ def test_update_query_with_empty_dict():
     assert url.update_query({}) == url
 
 
+def test_update_query_unchanged_returns_same_url():
+    url = URL("http://example.com/?foo=bar&baz=foo")
+    assert url.update_query({}) is url
+    assert url.update_query("") is url
+
+
 def test_with_query_list_of_pairs():
     url = URL("http://example.com")
     assert str(url.with_query([("a", "1")])) == "http://example.com/?a=1"
@@ -40,6 +40,16 @@ def test_is():
     assert u1 is u2
 
 
+def test_str_parsing_is_cached_per_encoded_flag():
+    url = URL("http://example.com/%7Epath")
+    encoded_url = URL("http://example.com/%7Epath", encoded=True)
+    assert URL("http://example.com/%7Epath") is url
+    assert URL("http://example.com/%7Epath", encoded=True) is encoded_url
+    assert url is not encoded_url
+    assert url.raw_path == "/~path"
+    assert encoded_url.raw_path == "/%7Epath"
+
+
 def test_bool():
     assert URL("http://example.com")
     assert not URL()
@@ -262,6 +272,19 @@ def test_host_with_underscore():
     assert "abc_def.com" == url.host
 
 
+@pytest.mark.parametrize(
+    ("input", "result"),
+    [
+        ("http://example.com", "example.com"),
+        ("http://EXAMPLE.com", "example.com"),
+        ("http://xn--einla-pqa.de", "einlaß.de"),
+        ("http://XN--EINLA-PQA.de", "einlaß.de"),
+    ],
+)
+def test_host_ascii_fast_path(input: str, result: str) -> None:
+    assert URL(input, encoded=True).host == result
+
+
 def test_raw_host_when_port_is_specified():
     url = URL("http://example.com:8888")
     assert "example.com" == url.raw_host
@@ -291,6 +314,27 @@ def test_authority_short() -> None:
     assert url.raw_authority == "host.com"
 
 
+@pytest.mark.parametrize(
+    ("input", "authority", "result"),
+    [
+        ("http://host.com:80/path", "host.com:80", "http://host.com/path"),
+        (
+            "http://user@host.com:80/path",
+            "user@host.com:80",
+            "http://user@host.com/path",
+        ),
+    ],
+)
+def test_authority_default_port(input: str, authority: str, result: str) -> None:
+    url = URL(input)
+    assert url.authority == authority
+    assert str(url) == result
+
+
+def test_str_default_port_without_host() -> None:
+    assert str(URL("http://:80/", encoded=True)) == "http:///"
+
+
 def test_authority_full_nonasci() -> None:
     url = URL("http://степан:пароль@слава.укр:8080/path")
     assert url.raw_authority == (
@@ -895,6 +939,15 @@ def test_div():
     assert url.raw_path == "/path/to"
 
 
+def test_div_file_name_does_not_normalize(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(segments: object) -> None:
+        assert False, "normalize_path_segments should not be called"
+
+    monkeypatch.setattr("yarl._url.normalize_path_segments", fail)
+    url = URL("http://example.com/path") / "index.html"
+    assert url.raw_path == "/path/index.html"
+
+
 def test_div_with_slash():
     url = URL("http://example.com/path/") / "to"
     assert str(url) == "http://example.com/path/to"
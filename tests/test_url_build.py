@@ -139,6 +139,26 @@ def test_build_with_invalid_host(host: str, is_authority: bool):
         URL.build(host=host)
 
 
+@pytest.mark.parametrize(
+    ("host", "value", "pos"),
+    [
+        ("a%zf", "%", 1),
+        ("a%f", "%", 1),
+        ("a%2f%", "%", 4),
+        ("a%2f%g/", "%", 4),
+        ("a/%2", "/", 1),
+    ],
+)
+def test_build_with_invalid_host_position(host: str, value: str, pos: int) -> None:
+    match = f"Host '{host}' cannot contain '{value}' \\(at position {pos}\\)$"
+    with pytest.raises(ValueError, match=match):
+        URL.build(host=host)
+
+
+def test_build_with_percent_encoded_host() -> None:
+    assert URL.build(scheme="http", host="a%2fb%41").raw_host == "a%2fb%41"
+
+
 def test_build_with_authority():
     url = URL.build(scheme="http", authority="степан:bar@host.com:8000", path="/path")
     assert (
@@ -28,6 +28,21 @@ def normalize_path_segments(segments: Sequence[str]) -> list[str]:
     return resolved_path
 
 
+def has_dot_segments(path: str) -> bool:
+    """Check if a str path contains any '.' or '..' segments."""
+    # Most paths with dots only have them in file names and
+    # extensions, so check the segment boundaries explicitly.
+    if "." not in path:
+        return False
+    return (
+        "/./" in path
+        or "/../" in path
+        or path.endswith(("/.", "/.."))
+        or path.startswith(("./", "../"))
+        or path in (".", "..")
+    )
+
+
 def normalize_path(path: str) -> str:
     # Drop '.' and '..' from str path
     prefix = ""
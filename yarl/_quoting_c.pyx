@@ -27,11 +27,10 @@ cdef str QS = '+&=;'
 DEF BUF_SIZE = 8 * 1024  # 8KiB
 cdef char BUFFER[BUF_SIZE]
 
+cdef const char *HEX_DIGITS = b"0123456789ABCDEF"
+
 cdef inline Py_UCS4 _to_hex(uint8_t v) noexcept:
-    if v < 10:
-        return <Py_UCS4>(v+0x30)  # ord('0') == 0x30
-    else:
-        return <Py_UCS4>(v+0x41-10)  # ord('A') == 0x41
+    return <Py_UCS4>HEX_DIGITS[v]
 
 
 cdef inline int _from_hex(Py_UCS4 v) noexcept:
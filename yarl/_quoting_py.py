@@ -1,10 +1,11 @@
 import codecs
 import re
-from string import ascii_letters, ascii_lowercase, digits
+from string import ascii_letters, digits, hexdigits
 from typing import cast
 
-BASCII_LOWERCASE = ascii_lowercase.encode("ascii")
-BPCT_ALLOWED = {f"%{i:02X}".encode("ascii") for i in range(256)}
+# Percent-encoded form of every byte value, indexed by the byte.
+_PCT_BYTES = tuple(f"%{i:02X}".encode("ascii") for i in range(256))
+BPCT_ALLOWED = set(_PCT_BYTES)
 GEN_DELIMS = ":/?#[]@"
 SUB_DELIMS_WITHOUT_QS = "!$'()*,"
 SUB_DELIMS = SUB_DELIMS_WITHOUT_QS + "+&=;"
@@ -13,8 +14,14 @@ UNRESERVED = ascii_letters + digits + "-._~"
 ALLOWED = UNRESERVED + SUB_DELIMS_WITHOUT_QS
 
 
-_IS_HEX = re.compile(b"[A-Z0-9][A-Z0-9]")
-_IS_HEX_STR = re.compile("[A-Fa-f0-9][A-Fa-f0-9]")
+# Value of every hex digit byte, 0xFF for the other bytes.
+_HEX_NIBBLE = bytes(
+    int(chr(i), 16) if chr(i) in hexdigits else 0xFF for i in range(256)
+)
+# Maps every two hex digit string, in any case, to the byte it encodes.
+_HEX_PAIR_TO_BYTE = {
+    a + b: bytes([int(a + b, 16)]) for a in hexdigits for b in hexdigits
+}
 
 utf8_decoder = codecs.getincrementaldecoder("utf-8")
 
@@ -32,6 +39,26 @@ class _Quoter:
         self._protected = protected
         self._qs = qs
         self._requote = requote
+        if not (safe + protected).isascii():
+            raise ValueError("Only safe symbols with ORD < 128 are allowed")
+        all_safe = safe + ALLOWED + ("" if qs else "+&=;") + protected
+        self._all_safe = all_safe
+        self._bsafe = all_safe.encode("ascii")
+        # Quoted form of the unsafe ASCII characters, for str.translate().
+        self._ascii_table = {
+            i: "+" if qs and i == 32 else f"%{i:02X}"
+            for i in range(128)
+            if (qs and i == 32) or chr(i) not in all_safe
+        }
+        # Matches strings that are already quoted: only safe characters
+        # and, when requoting, pct-encoded sequences that would be kept as is.
+        if requote:
+            unquoted = "|".join(f"{ord(c):02X}" for c in all_safe if c not in protected)
+            self._already_quoted = re.compile(
+                f"(?:[{re.escape(all_safe)}]|%(?!{unquoted})[0-9A-F]{{2}})*"
+            )
+        else:
+            self._already_quoted = re.compile(f"[{re.escape(all_safe)}]*")
 
     def __call__(self, val: str) -> str:
         if val is None:
@@ -40,73 +67,70 @@ class _Quoter:
             raise TypeError("Argument should be str")
         if not val:
             return ""
+        if self._already_quoted.fullmatch(val):
+            return val
+        if val.isascii() and (not self._requote or "%" not in val):
+            # Nothing to requote, so each character maps to a fixed output.
+            return val.translate(self._ascii_table)
         bval = val.encode("utf8", errors="ignore")
         ret = bytearray()
+        ret_append = ret.append
+        ret_extend = ret.extend
         pct = bytearray()
-        safe = self._safe
-        safe += ALLOWED
-        if not self._qs:
-            safe += "+&=;"
-        safe += self._protected
-        bsafe = safe.encode("ascii")
+        safe = self._all_safe
+        bsafe = self._bsafe
         idx = 0
-        while idx < len(bval):
+        bval_len = len(bval)
+        while idx < bval_len:
             ch = bval[idx]
             idx += 1
 
             if pct:
-                if ch in BASCII_LOWERCASE:
-                    ch = ch - 32  # convert to uppercase
                 pct.append(ch)
                 if len(pct) == 3:  # pragma: no branch   # peephole optimizer
-                    buf = pct[1:]
-                    if not _IS_HEX.match(buf):
-                        ret.extend(b"%25")
-                        pct.clear()
-                        idx -= 2
-                        continue
-                    try:
-                        unquoted = chr(int(pct[1:].decode("ascii"), base=16))
-                    except ValueError:
-                        ret.extend(b"%25")
+                    hi = _HEX_NIBBLE[pct[1]]
+                    lo = _HEX_NIBBLE[pct[2]]
+                    if hi > 15 or lo > 15:
+                        ret_extend(b"%25")
                         pct.clear()
                         idx -= 2
                         continue
+                    code = hi << 4 | lo
+                    unquoted = chr(code)
 
-                    if unquoted in self._protected:
-                        ret.extend(pct)
-                    elif unquoted in safe:
-                        ret.append(ord(unquoted))
+                    if unquoted in safe and unquoted not in self._protected:
+                        ret_append(code)
                     else:
-                        ret.extend(pct)
+                        # Keep the escape, normalized to uppercase hex digits.
+                        ret_extend(_PCT_BYTES[code])
                     pct.clear()
 
                 # special case, if we have only one char after "%"
-                elif len(pct) == 2 and idx == len(bval):
-                    ret.extend(b"%25")
+                elif len(pct) == 2 and idx == bval_len:
+                    ret_extend(b"%25")
                     pct.clear()
                     idx -= 1
 
                 continue
 
-            elif ch == ord("%") and self._requote:
+            elif ch == 37 and self._requote:  # "%"
                 pct.clear()
                 pct.append(ch)
 
                 # special case if "%" is last char
-                if idx == len(bval):
-                    ret.extend(b"%25")
+                if idx == bval_len:
+                    ret_extend(b"%25")
 
                 continue
 
-            if self._qs and ch == ord(" "):
-                ret.append(ord("+"))
+            if self._qs and ch == 32:  # " "
+                ret_append(43)  # "+"
                 continue
             if ch in bsafe:
-                ret.append(ch)
+                ret_append(ch)
                 continue
 
-            ret.extend((f"%{ch:02X}").encode("ascii"))
+            ret_extend(_PCT_BYTES[ch])
 
         ret2 = ret.decode("ascii")
         if ret2 == val:
@@ -119,8 +143,16 @@ class _Unquoter:
         self._ignore = ignore
         self._unsafe = unsafe
         self._qs = qs
-        self._quoter = _Quoter()
-        self._qs_quoter = _Quoter(qs=True)
+        # Characters the loop below may change; everything else is copied.
+        special = "%" + ("+" if qs else "") + unsafe
+        self._unsafe_pct = {c: f"%{ord(c):X}" for c in unsafe}
+        self._special = re.compile(f"[{re.escape(special)}]")
+        # Decoded characters that must stay escaped, mapped to their quoted form.
+        quoter = _Quoter()
+        self._requoted = {c: quoter(c) for c in unsafe + ignore}
+        if qs:
+            qs_quoter = _Quoter(qs=True)
+            self._requoted.update({c: qs_quoter(c) for c in "+=&;"})
 
     def __call__(self, val: str) -> str:
         if val is None:
@@ -130,66 +162,66 @@ class _Unquoter:
         if not val:
             return ""
         decoder = cast(codecs.BufferedIncrementalDecoder, utf8_decoder())
-        ret = []
+        ret: list[str] = []
+        ret_append = ret.append
+        special_search = self._special.search
+        requoted = self._requoted
+        unsafe_pct = self._unsafe_pct
         idx = 0
-        while idx < len(val):
+        val_len = len(val)
+        while idx < val_len:
+            if not decoder.buffer:
+                # Copy the run of plain characters up to the next special one.
+                match = special_search(val, idx)
+                end = match.start() if match else val_len
+                if end != idx:
+                    ret_append(val[idx:end])
+                    idx = end
+                    if idx == val_len:
+                        break
             ch = val[idx]
             idx += 1
-            if ch == "%" and idx <= len(val) - 2:
+            if ch == "%" and idx <= val_len - 2:
                 pct = val[idx : idx + 2]
-                if _IS_HEX_STR.fullmatch(pct):
-                    b = bytes([int(pct, base=16)])
+                b = _HEX_PAIR_TO_BYTE.get(pct)
+                if b is not None:
                     idx += 2
                     try:
                         unquoted = decoder.decode(b)
                     except UnicodeDecodeError:
                         start_pct = idx - 3 - len(decoder.buffer) * 3
-                        ret.append(val[start_pct : idx - 3])
+                        ret_append(val[start_pct : idx - 3])
                         decoder.reset()
                         try:
                             unquoted = decoder.decode(b)
                         except UnicodeDecodeError:
-                            ret.append(val[idx - 3 : idx])
+                            ret_append(val[idx - 3 : idx])
                             continue
                     if not unquoted:
                         continue
-                    if self._qs and unquoted in "+=&;":
-                        to_add = self._qs_quoter(unquoted)
-                        if to_add is None:  # pragma: no cover
-                            raise RuntimeError("Cannot quote None")
-                        ret.append(to_add)
-                    elif unquoted in self._unsafe or unquoted in self._ignore:
-                        to_add = self._quoter(unquoted)
-                        if to_add is None:  # pragma: no cover
-                            raise RuntimeError("Cannot quote None")
-                        ret.append(to_add)
-                    else:
-                        ret.append(unquoted)
+                    ret_append(requoted.get(unquoted, unquoted))
                     continue
 
             if decoder.buffer:
                 start_pct = idx - 1 - len(decoder.buffer) * 3
-                ret.append(val[start_pct : idx - 1])
+                ret_append(val[start_pct : idx - 1])
                 decoder.reset()
 
             if ch == "+":
                 if not self._qs or ch in self._unsafe:
-                    ret.append("+")
+                    ret_append("+")
                 else:
-                    ret.append(" ")
+                    ret_append(" ")
                 continue
 
-            if ch in self._unsafe:
-                ret.append("%")
-                h = hex(ord(ch)).upper()[2:]
-                for ch in h:
-                    ret.append(ch)
+            if (escaped := unsafe_pct.get(ch)) is not None:
+                ret_append(escaped)
                 continue
 
-            ret.append(ch)
+            ret_append(ch)
 
         if decoder.buffer:
-            ret.append(val[-len(decoder.buffer) * 3 :])
+            ret_append(val[-len(decoder.buffer) * 3 :])
 
         ret2 = "".join(ret)
         if ret2 == val:
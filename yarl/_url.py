@@ -20,7 +20,7 @@ from ._parse import (
     split_url,
     unsplit_result,
 )
-from ._path import normalize_path, normalize_path_segments
+from ._path import has_dot_segments, normalize_path, normalize_path_segments
 from ._query import (
     Query,
     QueryVariable,
@@ -54,20 +54,12 @@ SCHEME_REQUIRES_HOST = frozenset(("http", "https", "ws", "wss", "ftp"))
 
 
 # reg-name: unreserved / pct-encoded / sub-delims
-# this pattern matches anything that is *not* in those classes. and is only used
-# on lower-cased ASCII values.
-NOT_REG_NAME = re.compile(
-    r"""
-        # any character not in the unreserved or sub-delims sets, plus %
-        # (validated with the additional check for pct-encoded sequences below)
-        [^a-z0-9\-._~!$&'()*+,;=%]
-    |
-        # % only allowed if it is part of a pct-encoded
-        # sequence of 2 hex digits.
-        %(?![0-9a-f]{2})
-    """,
-    re.VERBOSE,
-)
+# this pattern matches any character that is *not* in the unreserved or
+# sub-delims sets, plus %, and is only used on lower-cased ASCII values.
+# A % is only allowed if it is part of a pct-encoded sequence of 2 hex digits,
+# which is validated separately by _find_invalid_reg_name().
+NOT_REG_NAME = re.compile(r"[^a-z0-9\-._~!$&'()*+,;=%]")
+_LOWER_HEX_DIGITS = frozenset("0123456789abcdef")
 
 _T = TypeVar("_T")
 
@@ -94,6 +86,7 @@ class CacheInfo(TypedDict):
     ip_address: _CacheInfo
     host_validate: _CacheInfo
     encode_host: _CacheInfo
+    parse_url: _CacheInfo
 
 
 class _InternalURLCache(TypedDict, total=False):
@@ -108,11 +101,13 @@ class _InternalURLCache(TypedDict, total=False):
     raw_password: Union[str, None]
     password: Union[str, None]
     raw_host: Union[str, None]
+    _is_ipv6: bool
     host: Union[str, None]
     host_subcomponent: Union[str, None]
     host_port_subcomponent: Union[str, None]
     port: Union[int, None]
     explicit_port: Union[int, None]
+    _netloc_parts: tuple[Union[str, None], Union[str, None], str, Union[int, None]]
     raw_path: str
     path: str
     _parsed_query: list[tuple[str, str]]
@@ -139,7 +134,6 @@ def rewrite_module(obj: _T) -> _T:
     return obj
 
 
-@lru_cache
 def encode_url(url_str: str) -> "URL":
     """Parse unencoded URL."""
     cache: _InternalURLCache = {}
@@ -165,7 +159,9 @@ def encode_url(url_str: str) -> "URL":
                 host = ""
         host = _encode_host(host, validate_host=False)
         # Remove brackets as host encoder adds back brackets for IPv6 addresses
-        cache["raw_host"] = host[1:-1] if "[" in host else host
+        cache["raw_host"] = raw_host = host[1:-1] if "[" in host else host
+        cache["_is_ipv6"] = is_ipv6 = ":" in raw_host
+        cache["host_subcomponent"] = f"[{raw_host}]" if is_ipv6 else raw_host
         cache["explicit_port"] = port
         if password is None and username is None:
             # Fast path for URLs without user, password
@@ -181,7 +177,7 @@ def encode_url(url_str: str) -> "URL":
 
     if path:
         path = PATH_REQUOTER(path)
-        if netloc and "." in path:
+        if netloc and has_dot_segments(path):
             path = normalize_path(path)
     if query:
         query = QUERY_REQUOTER(query)
@@ -189,6 +185,7 @@ def encode_url(url_str: str) -> "URL":
         fragment = FRAGMENT_REQUOTER(fragment)
 
     cache["scheme"] = scheme
+    cache["absolute"] = netloc != ""
     cache["raw_path"] = "/" if not path and netloc else path
     cache["raw_query_string"] = query
     cache["raw_fragment"] = fragment
@@ -203,7 +200,6 @@ def encode_url(url_str: str) -> "URL":
     return self
 
 
-@lru_cache
 def pre_encoded_url(url_str: str) -> "URL":
     """Parse pre-encoded URL."""
     self = object.__new__(URL)
@@ -213,6 +209,15 @@ def pre_encoded_url(url_str: str) -> "URL":
     return self
 
 
+_DEFAULT_URL_SIZE = 512
+
+
+@lru_cache(_DEFAULT_URL_SIZE)
+def parse_url(url_str: str, encoded: bool) -> "URL":
+    """Parse URL, sharing a single LRU cache for encoded and unencoded URLs."""
+    return pre_encoded_url(url_str) if encoded else encode_url(url_str)
+
+
 @lru_cache
 def build_pre_encoded_url(
     scheme: str,
@@ -334,6 +339,10 @@ class URL:
     #               / path-noscheme
     #               / path-empty
     # absolute-URI  = scheme ":" hier-part [ "?" query ]
+
+    # _cache must stay a dict: propcache's under_cached_property reads and
+    # writes it directly from C, which is faster than any descriptor
+    # storing the values in per-property slots.
     __slots__ = ("_cache", "_scheme", "_netloc", "_path", "_query", "_fragment")
 
     _scheme: str
@@ -352,7 +361,7 @@ class URL:
         if strict is not None:  # pragma: no cover
             warnings.warn("strict parameter is ignored")
         if type(val) is str:
-            return pre_encoded_url(val) if encoded else encode_url(val)
+            return parse_url(val, encoded)
         if type(val) is cls:
             return val
         if type(val) is SplitResult:
@@ -360,11 +369,11 @@ class URL:
                 raise ValueError("Cannot apply decoding to SplitResult")
             return from_parts(*val)
         if isinstance(val, str):
-            return pre_encoded_url(str(val)) if encoded else encode_url(str(val))
+            return parse_url(str(val), encoded)
         if val is UNDEFINED:
             # Special case for UNDEFINED since it might be unpickling and we do
             # not want to cache as the `__set_state__` call would mutate the URL
-            # object in the `pre_encoded_url` or `encoded_url` caches.
+            # object in the `parse_url` cache.
             self = object.__new__(URL)
             self._scheme = self._netloc = self._path = self._query = self._fragment = ""
             self._cache = {}
@@ -449,7 +458,7 @@ class URL:
 
         path = PATH_QUOTER(path) if path else path
         if path and self._netloc:
-            if "." in path:
+            if has_dot_segments(path):
                 path = normalize_path(path)
             if path[0] != "/":
                 msg = (
@@ -561,6 +570,7 @@ class URL:
         c = self._cache
         split_loc = split_netloc(self._netloc)
         c["raw_user"], c["raw_password"], c["raw_host"], c["explicit_port"] = split_loc
+        c["_is_ipv6"] = (raw_host := c["raw_host"]) is not None and ":" in raw_host
 
     def is_absolute(self) -> bool:
         """A check for absolute URLs.
@@ -728,6 +738,11 @@ class URL:
         self._cache_netloc()
         return self._cache["raw_host"]
 
+    @cached_property
+    def _is_ipv6(self) -> bool:
+        """True if the host is an IPv6 address."""
+        return (raw := self.raw_host) is not None and ":" in raw
+
     @cached_property
     def host(self) -> Union[str, None]:
         """Decoded host part of URL.
@@ -740,6 +755,10 @@ class URL:
         if raw and raw[-1].isdigit() or ":" in raw:
             # IP addresses are never IDNA encoded
             return raw
+        if raw.isascii() and raw.islower() and "xn--" not in raw:
+            # Only "xn--" labels are changed by IDNA decoding,
+            # so plain lowercase ASCII hosts can skip it entirely
+            return raw
         return _idna_decode(raw)
 
     @cached_property
@@ -762,7 +781,19 @@ class URL:
         """
         if (raw := self.raw_host) is None:
             return None
-        return f"[{raw}]" if ":" in raw else raw
+        return f"[{raw}]" if self._is_ipv6 else raw
+
+    @cached_property
+    def _netloc_parts(
+        self,
+    ) -> tuple[Union[str, None], Union[str, None], str, Union[int, None]]:
+        """Raw user, raw password, encoded host and explicit port.
+
+        Shared by the with_*() netloc replacement methods.
+
+        """
+        host = self.host_subcomponent or ""
+        return self.raw_user, self.raw_password, host, self.explicit_port
 
     @cached_property
     def host_port_subcomponent(self) -> Union[str, None]:
@@ -797,10 +828,12 @@ class URL:
             # To avoid string manipulation we only call rstrip if
             # the last character is a dot.
             raw = raw.rstrip(".")
+        if self._is_ipv6:
+            raw = f"[{raw}]"
         port = self.explicit_port
         if port is None or port == DEFAULT_PORTS.get(self._scheme):
-            return f"[{raw}]" if ":" in raw else raw
-        return f"[{raw}]:{port}" if ":" in raw else f"{raw}:{port}"
+            return raw
+        return f"{raw}:{port}"
 
     @cached_property
     def port(self) -> Union[int, None]:
@@ -1010,8 +1043,9 @@ class URL:
             # path is already quoted and we do not want to double quote
             # the existing path.
             path = path if encoded else PATH_QUOTER(path)
-            needs_normalize |= "." in path
             segments = path.split("/")
+            if not needs_normalize:
+                needs_normalize = "." in segments or ".." in segments
             segments.reverse()
             # remove trailing empty segment for all but the last path
             parsed += segments[1:] if not last and segments[0] == "" else segments
@@ -1062,17 +1096,15 @@ class URL:
 
         """
         # N.B. doesn't cleanup query/fragment
-        if user is None:
-            password = None
-        elif isinstance(user, str):
+        if user is not None:
+            if not isinstance(user, str):
+                raise TypeError("Invalid user type")
             user = QUOTER(user)
-            password = self.raw_password
-        else:
-            raise TypeError("Invalid user type")
         if not (netloc := self._netloc):
             raise ValueError("user replacement is not allowed for relative URLs")
-        encoded_host = self.host_subcomponent or ""
-        netloc = make_netloc(user, password, encoded_host, self.explicit_port)
+        _, password, encoded_host, port = self._netloc_parts
+        password = None if user is None else password
+        netloc = make_netloc(user, password, encoded_host, port)
         return from_parts(self._scheme, netloc, self._path, self._query, self._fragment)
 
     def with_password(self, password: Union[str, None]) -> "URL":
@@ -1092,9 +1124,8 @@ class URL:
             raise TypeError("Invalid password type")
         if not (netloc := self._netloc):
             raise ValueError("password replacement is not allowed for relative URLs")
-        encoded_host = self.host_subcomponent or ""
-        port = self.explicit_port
-        netloc = make_netloc(self.raw_user, password, encoded_host, port)
+        user, _, encoded_host, port = self._netloc_parts
+        netloc = make_netloc(user, password, encoded_host, port)
         return from_parts(self._scheme, netloc, self._path, self._query, self._fragment)
 
     def with_host(self, host: str) -> "URL":
@@ -1114,8 +1145,8 @@ class URL:
         if not host:
             raise ValueError("host removing is not allowed")
         encoded_host = _encode_host(host, validate_host=True) if host else ""
-        port = self.explicit_port
-        netloc = make_netloc(self.raw_user, self.raw_password, encoded_host, port)
+        user, password, _, port = self._netloc_parts
+        netloc = make_netloc(user, password, encoded_host, port)
         return from_parts(self._scheme, netloc, self._path, self._query, self._fragment)
 
     def with_port(self, port: Union[int, None]) -> "URL":
@@ -1132,8 +1163,8 @@ class URL:
                 raise ValueError(f"port must be between 0 and 65535, got {port}")
         if not (netloc := self._netloc):
             raise ValueError("port replacement is not allowed for relative URLs")
-        encoded_host = self.host_subcomponent or ""
-        netloc = make_netloc(self.raw_user, self.raw_password, encoded_host, port)
+        user, password, encoded_host, _ = self._netloc_parts
+        netloc = make_netloc(user, password, encoded_host, port)
         return from_parts(self._scheme, netloc, self._path, self._query, self._fragment)
 
     def with_path(
@@ -1149,7 +1180,7 @@ class URL:
         if not encoded:
             path = PATH_QUOTER(path)
             if netloc:
-                path = normalize_path(path) if "." in path else path
+                path = normalize_path(path) if has_dot_segments(path) else path
         if path and path[0] != "/":
             path = f"/{path}"
         query = self._query if keep_query else ""
@@ -1239,7 +1270,7 @@ class URL:
         if in_query is None:
             query = ""
         elif not in_query:
-            query = self._query
+            return self
         elif isinstance(in_query, Mapping):
             qm: MultiDict[QueryVariable] = MultiDict(self._parsed_query)
             qm.update(in_query)
@@ -1405,7 +1436,7 @@ class URL:
                 # which has to be removed
                 if orig_path[0] == "/":
                     path = path[1:]
-            path = normalize_path(path) if "." in path else path
+            path = normalize_path(path) if has_dot_segments(path) else path
         else:
             path = orig_path
 
@@ -1461,6 +1492,24 @@ def _idna_encode(host: str) -> str:
         return host.encode("idna").decode("ascii")
 
 
+def _find_invalid_reg_name(host: str) -> int:
+    """Return the position of the first invalid reg-name character or -1."""
+    length = len(host)
+    end = invalid.start() if (invalid := NOT_REG_NAME.search(host)) else length
+    # Percent signs before the first invalid character must start a
+    # pct-encoded sequence; str.find() avoids a regex lookahead per "%".
+    idx = host.find("%", 0, end)
+    while idx != -1:
+        if (
+            idx + 2 >= length
+            or host[idx + 1] not in _LOWER_HEX_DIGITS
+            or host[idx + 2] not in _LOWER_HEX_DIGITS
+        ):
+            return idx
+        idx = host.find("%", idx + 3, end)
+    return -1 if end == length else end
+
+
 @lru_cache(_DEFAULT_ENCODE_SIZE)
 def _encode_host(host: str, validate_host: bool) -> str:
     """Encode host part of URL."""
@@ -1503,8 +1552,8 @@ def _encode_host(host: str, validate_host: bool) -> str:
         # Check for invalid characters explicitly; _idna_encode() does this
         # for non-ascii host names.
         host = host.lower()
-        if validate_host and (invalid := NOT_REG_NAME.search(host)):
-            value, pos, extra = invalid.group(), invalid.start(), ""
+        if validate_host and (pos := _find_invalid_reg_name(host)) != -1:
+            value, extra = host[pos], ""
             if value == "@" or (value == ":" and "@" in host[pos:]):
                 # this looks like an authority string
                 extra = (
@@ -1525,6 +1574,7 @@ def cache_clear() -> None:
     _idna_encode.cache_clear()
     _idna_decode.cache_clear()
     _encode_host.cache_clear()
+    parse_url.cache_clear()
 
 
 @rewrite_module
@@ -1536,6 +1586,7 @@ def cache_info() -> CacheInfo:
         "ip_address": _encode_host.cache_info(),
         "host_validate": _encode_host.cache_info(),
         "encode_host": _encode_host.cache_info(),
+        "parse_url": parse_url.cache_info(),
     }
 
 
@@ -1547,9 +1598,10 @@ def cache_configure(
     ip_address_size: Union[int, None, UndefinedType] = UNDEFINED,
     host_validate_size: Union[int, None, UndefinedType] = UNDEFINED,
     encode_host_size: Union[int, None, UndefinedType] = UNDEFINED,
+    parse_url_size: Union[int, None] = _DEFAULT_URL_SIZE,
 ) -> None:
     """Configure LRU cache sizes."""
-    global _idna_decode, _idna_encode, _encode_host
+    global _idna_decode, _idna_encode, _encode_host, parse_url
     # ip_address_size, host_validate_size are no longer
     # used, but are kept for backwards compatibility.
     if ip_address_size is not UNDEFINED or host_validate_size is not UNDEFINED:
@@ -1562,23 +1614,16 @@ def cache_configure(
             stacklevel=2,
         )
 
-    if encode_host_size is not None:
-        for size in (ip_address_size, host_validate_size):
-            if size is None:
-                encode_host_size = None
-            elif encode_host_size is UNDEFINED:
-                if size is not UNDEFINED:
-                    encode_host_size = size
-            elif size is not UNDEFINED:
-                if TYPE_CHECKING:
-                    assert isinstance(size, int)
-                    assert isinstance(encode_host_size, int)
-                encode_host_size = max(size, encode_host_size)
-        if encode_host_size is UNDEFINED:
-            encode_host_size = _DEFAULT_ENCODE_SIZE
+    sizes = (ip_address_size, host_validate_size, encode_host_size)
+    if None in sizes:
+        encode_host_size = None
+    else:
+        given = [size for size in sizes if isinstance(size, int)]
+        encode_host_size = max(given, default=_DEFAULT_ENCODE_SIZE)
 
     if TYPE_CHECKING:
         assert not isinstance(encode_host_size, object)
     _encode_host = lru_cache(encode_host_size)(_encode_host.__wrapped__)
     _idna_decode = lru_cache(idna_decode_size)(_idna_decode.__wrapped__)
     _idna_encode = lru_cache(idna_encode_size)(_idna_encode.__wrapped__)
+    parse_url = lru_cache(parse_url_size)(parse_url.__wrapped__)